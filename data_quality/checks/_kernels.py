@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+# Below this many elements the numba kernels' compile and thread start-up costs
+# outweigh the single fused pass, so the numpy expressions are used instead.
+JIT_MIN_SIZE = 100_000
+
+
+def _count_out_of_range_numpy(arr, lo, hi):
+    return np.count_nonzero((arr < lo) | (arr > hi))
+
+
+def _nanvar_numpy(arr, ddof):
+    if np.count_nonzero(~np.isnan(arr)) - ddof <= 0:
+        return np.nan
+    return np.nanvar(arr, ddof=ddof)
+
+
+def _fused_stats_numpy(arr, lo, hi):
+    mask = np.isnan(arr)
+    valid = arr[~mask]
+    outliers = np.count_nonzero((valid < lo) | (valid > hi))
+    m2 = float(((valid - valid.mean()) ** 2).sum()) if valid.size else 0.0
+    return int(mask.sum()), outliers, valid.size, m2
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True)
+    def _count_out_of_range(arr, lo, hi):
+        count = 0
+        for i in prange(arr.size):
+            count += (arr[i] < lo) | (arr[i] > hi)
+        return count
+
+    @njit(cache=True)
+    def _nanvar(arr, ddof):
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(arr.size):
+            x = arr[i]
+            if x != x:
+                continue
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+        if n - ddof <= 0:
+            return np.nan
+        return m2 / (n - ddof)
+
+    @njit(cache=True)
+    def _fused_stats(arr, lo, hi):
+        nulls = 0
+        outliers = 0
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(arr.size):
+            x = arr[i]
+            if x != x:
+                nulls += 1
+                continue
+            if x < lo or x > hi:
+                outliers += 1
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+        return nulls, outliers, n, m2
+
+else:
+
+    _count_out_of_range = _count_out_of_range_numpy
+    _nanvar = _nanvar_numpy
+    _fused_stats = _fused_stats_numpy
+
+
+def count_out_of_range(arr, lo, hi):
+    """
+    Count the values of a numeric array lying outside [lo, hi].
+
+    NaN values are never counted as out of range.
+    """
+    if arr.size < JIT_MIN_SIZE:
+        return int(_count_out_of_range_numpy(arr, lo, hi))
+    return int(_count_out_of_range(arr, lo, hi))
+
+
+def nanvar(arr, ddof=1):
+    """
+    Single-pass variance of a numeric array, skipping NaN values.
+
+    Uses bottleneck when installed, otherwise the Welford kernel above for
+    large arrays. Returns NaN when fewer than ``ddof + 1`` valid values are present.
+    """
+    arr = arr.astype(np.float64, copy=False)
+    if bn is not None:
+        return float(bn.nanvar(arr, ddof=ddof))
+    if arr.size < JIT_MIN_SIZE:
+        return float(_nanvar_numpy(arr, ddof))
+    return float(_nanvar(arr, ddof))
+
+
+def fused_column_stats(arr, lo, hi, ddof=1):
+    """
+    Count nulls and values outside [lo, hi] and compute the variance of a
+    numeric array in a single scan.
+
+    Returns:
+    tuple: (null count, out-of-range count, variance skipping NaN values).
+    """
+    arr = arr.astype(np.float64, copy=False)
+    stats = _fused_stats_numpy if arr.size < JIT_MIN_SIZE else _fused_stats
+    nulls, outliers, n, m2 = stats(arr, lo, hi)
+    variance = m2 / (n - ddof) if n - ddof > 0 else np.nan
+    return int(nulls), int(outliers), float(variance)
+
+
+def move_mean_std(arr, window, ddof=0):
+    """
+    Rolling mean and standard deviation over windows ending at each position.
+
+    Uses bottleneck when installed, otherwise pandas' rolling reductions.
+    The first ``window - 1`` positions are NaN.
+    """
+    arr = np.asarray(arr, dtype=np.float64)
+    if window > arr.size:
+        return np.full(arr.size, np.nan), np.full(arr.size, np.nan)
+    if bn is not None:
+        return bn.move_mean(arr, window), bn.move_std(arr, window, ddof=ddof)
+    rolling = pd.Series(arr).rolling(window)
+    return rolling.mean().to_numpy(), rolling.std(ddof=ddof).to_numpy()
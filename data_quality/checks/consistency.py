@@ -1,6 +1,154 @@
+import math
+import os
+import sys
+import warnings
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from functools import lru_cache, partial, wraps
+
 import pandas as pd
 import numpy as np
+from pandas.errors import PerformanceWarning
 from data_quality_checks import DataQualityChecks
+from _kernels import count_out_of_range, fused_column_stats, move_mean_std, nanvar
+from utils import RecordCountBuffer
+
+
+# metrics_non_null only fans out across threads for frames at least this wide and large.
+_PARALLEL_MIN_COLUMNS = 8
+_PARALLEL_MIN_CELLS = 10**6
+
+
+class Check(IntEnum):
+    """
+    Consistency check types accepted by ConsistencyChecks.metrics and .rules.
+    """
+
+    UNIQUE_IDENTIFIERS = 0
+    SCHEMA_CONSISTENCY = 1
+    NON_NULL = 2
+    THRESHOLD = 3
+    DYNAMIC_THRESHOLD = 4
+    VARIANCE = 5
+    RECORD_ANOMALIES = 6
+    NON_ZERO_RECORDS = 7
+    COLUMN_NAME_CONSISTENCY = 8
+
+
+_CHECKS_BY_NAME = {check.name.lower(): check for check in Check}
+
+
+def _check_from_name(check_type, kind):
+    try:
+        return _CHECKS_BY_NAME[check_type]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown check type for {kind}: {check_type}") from None
+
+
+def _col(df, column):
+    return df[column].to_numpy(copy=False)
+
+
+_converted_dtypes = set()
+
+
+def _caller_stacklevel():
+    # warnings.warn stacklevel, relative to the function calling this helper, of the
+    # first frame outside this module, whichever public entry point was used.
+    frame = sys._getframe(1)
+    level = 1
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+        level += 1
+    return level
+
+
+def _null_count(df, column):
+    col = df[column]
+    if pd.api.types.is_extension_array_dtype(col.dtype):
+        # Extension arrays carry their own missing-value mask; avoid materialising objects.
+        return int(col.array.isna().sum())
+    arr = col.to_numpy(copy=False)
+    if arr.dtype.kind in "iub":
+        # numpy integer and bool arrays cannot hold missing values.
+        return 0
+    if arr.dtype.kind == "f":
+        return int(np.count_nonzero(np.isnan(arr)))
+    return int(np.count_nonzero(pd.isna(arr)))
+
+
+def _numeric_col(df, column):
+    col = df[column]
+    if pd.api.types.is_extension_array_dtype(col.dtype) and pd.api.types.is_numeric_dtype(col.dtype):
+        if col.dtype not in _converted_dtypes:
+            _converted_dtypes.add(col.dtype)
+            warnings.warn(
+                f"Column {column!r} has extension dtype {col.dtype}, which is slow to compare and "
+                f"reduce; converting it to float64 for consistency checks. Store the column with a "
+                f"numpy dtype to avoid the conversion.",
+                PerformanceWarning,
+                stacklevel=_caller_stacklevel(),
+            )
+        return col.to_numpy(dtype="float64", na_value=np.nan)
+    return col.to_numpy(copy=False)
+
+
+def _count_out_of_range_series(col, lo, hi):
+    # Non-numeric columns go through pandas comparisons, which treat missing values as in range.
+    return int(((col < lo) | (col > hi)).sum())
+
+
+@lru_cache(maxsize=32)
+def _as_index(columns):
+    return pd.Index(columns)
+
+
+def _expected_index(columns, prebuilt=None):
+    if prebuilt is None:
+        return _as_index(tuple(columns))
+    if isinstance(prebuilt, pd.Index):
+        return prebuilt
+    return _as_index(tuple(prebuilt))
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple, pd.Index)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _evict_frame(cache, finalizers, frame_id):
+    cache.pop(frame_id, None)
+    finalizers.pop(frame_id, None)
+
+
+def _memoize_on_df(method):
+    """
+    Cache a metrics method's result per dataframe object and arguments.
+
+    Entries are keyed on ``id(df)`` and evicted when the dataframe is garbage
+    collected. Mutating a dataframe in place does not invalidate them; call
+    ``clear_cache()`` in that case. Calls with unhashable arguments are not cached.
+    Dict results are copied on the way out so callers cannot alter the cached value.
+    """
+    @wraps(method)
+    def wrapper(self, df, *args, **kwargs):
+        key = (method.__name__, _freeze(args), tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, df, *args, **kwargs)
+
+        results = self._frame_cache(df)
+        if key not in results:
+            results[key] = method(self, df, *args, **kwargs)
+        result = results[key]
+        return dict(result) if isinstance(result, dict) else result
+    return wrapper
 
 
 class ConsistencyChecks(DataQualityChecks):
@@ -8,49 +156,105 @@ class ConsistencyChecks(DataQualityChecks):
     Implements consistency checks as a child of DataQualityChecks.
     """
 
+    def __init__(self):
+        # key -> [n, mean, M2, window] rolling Welford accumulator fed by update_record_counts.
+        self._anomaly_state = {}
+        # id(df) -> {(method name, args, kwargs): result} for the memoized metrics methods,
+        # plus {("fused_column_metrics", column): result} from fused_column_metrics.
+        self._cache = {}
+        # id(df) -> weakref.finalize evicting that frame's entries once it is collected.
+        self._finalizers = {}
+        # Dispatch tables indexed by Check; entry i handles Check(i).
+        self._metrics_tbl = tuple(getattr(self, f"metrics_{check.name.lower()}") for check in Check)
+        self._rules_tbl = tuple(getattr(self, f"rules_{check.name.lower()}") for check in Check)
+
+    @classmethod
+    def prepare(cls, df):
+        """
+        Return a dataframe whose columns are laid out contiguously in memory.
+
+        A dataframe built from a row-major 2D array stores each column as a
+        strided view, which makes the column-wise checks in this class
+        cache-unfriendly. Call this once before running a batch of checks.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to check.
+
+        Returns:
+        pd.DataFrame: ``df`` itself if already column-contiguous, otherwise a copy.
+        """
+        for i, dtype in enumerate(df.dtypes):
+            if not isinstance(dtype, np.dtype):
+                continue
+            if not df.iloc[:, i].to_numpy(copy=False).flags["C_CONTIGUOUS"]:
+                return df.copy()
+        return df
+
+    def fused_column_metrics(self, df, column, lo, hi):
+        """
+        Compute the null count, the number of values outside [lo, hi] and the
+        variance of a numeric column in a single scan.
+
+        The results are remembered for ``df`` so that subsequent calls to
+        metrics_non_null, metrics_threshold (with the same bounds) and
+        metrics_variance on the same column reuse them instead of re-reading
+        the column. They share the per-dataframe memo cache, so they are
+        evicted with the dataframe and dropped by clear_cache(); call that
+        after mutating the dataframe in place.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to check.
+        column (str): The numeric column to scan.
+        lo (float): Lower bound of the accepted range.
+        hi (float): Upper bound of the accepted range.
+
+        Returns:
+        dict: {"nulls": int, "outliers": int, "variance": float}
+        """
+        arr = _numeric_col(df, column)
+        if arr.dtype.kind not in "fiu":
+            raise TypeError(f"Column {column!r} is not numeric.")
+        nulls, outliers, variance = fused_column_stats(arr, lo, hi)
+        result = {"nulls": nulls, "outliers": outliers, "variance": variance, "lo": lo, "hi": hi}
+        self._frame_cache(df)[("fused_column_metrics", column)] = result
+        return {"nulls": nulls, "outliers": outliers, "variance": variance}
+
+    def _fused_lookup(self, df, column):
+        results = self._cache.get(id(df))
+        if results is None:
+            return None
+        return results.get(("fused_column_metrics", column))
+
+    def _frame_cache(self, df):
+        frame_id = id(df)
+        if frame_id not in self._finalizers:
+            self._finalizers[frame_id] = weakref.finalize(df, _evict_frame, self._cache, self._finalizers, frame_id)
+        return self._cache.setdefault(frame_id, {})
+
+    def clear_cache(self):
+        """
+        Forget all memoized metric results, e.g. after mutating a dataframe in place.
+        """
+        self._cache.clear()
+
     def metrics(self, check_type, *args, **kwargs):
         """
         Dynamically call the metrics method for the given check type.
         """
-        metrics_methods = {
-            "unique_identifiers": self.metrics_unique_identifiers,
-            "schema_consistency": self.metrics_schema_consistency,
-            "non_null": self.metrics_non_null,
-            "threshold": self.metrics_threshold,
-            "dynamic_threshold": self.metrics_dynamic_threshold,
-            "variance": self.metrics_variance,
-            "record_anomalies": self.metrics_record_anomalies,
-            "non_zero_records": self.metrics_non_zero_records,
-            "column_name_consistency": self.metrics_column_name_consistency,
-        }
-
-        if check_type in metrics_methods:
-            return metrics_methods[check_type](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown check type for metrics: {check_type}")
+        if not isinstance(check_type, Check):
+            check_type = _check_from_name(check_type, "metrics")
+        return self._metrics_tbl[check_type](*args, **kwargs)
 
     def rules(self, check_type, *args, **kwargs):
         """
         Dynamically call the rules method for the given check type.
         """
-        rules_methods = {
-            "unique_identifiers": self.rules_unique_identifiers,
-            "schema_consistency": self.rules_schema_consistency,
-            "non_null": self.rules_non_null,
-            "threshold": self.rules_threshold,
-            "dynamic_threshold": self.rules_dynamic_threshold,
-            "variance": self.rules_variance,
-            "record_anomalies": self.rules_record_anomalies,
-            "non_zero_records": self.rules_non_zero_records,
-            "column_name_consistency": self.rules_column_name_consistency,
-        }
-
-        if check_type in rules_methods:
-            return rules_methods[check_type](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown check type for rules: {check_type}")
+        if not isinstance(check_type, Check):
+            check_type = _check_from_name(check_type, "rules")
+        return self._rules_tbl[check_type](*args, **kwargs)
 
     # Unique Identifier Consistency
+    @_memoize_on_df
     def metrics_unique_identifiers(self, df, id_col):
         """
         Calculate the number of duplicate unique identifiers in the specified column.
@@ -62,86 +266,290 @@ class ConsistencyChecks(DataQualityChecks):
         Returns:
         int: The number of duplicate unique identifiers.
         """
-        return df[id_col].duplicated().sum()
+        arr = _col(df, id_col)
+        if arr.dtype.kind in "iuM" and pd.Index(arr, copy=False).is_monotonic_increasing:
+            # Sorted ids (e.g. sequences, timestamps) can only repeat next to each other, so
+            # duplicates are counted from adjacent pairs without hashing the column.
+            return int(np.count_nonzero(arr[1:] == arr[:-1]))
+        return int(arr.size - pd.unique(arr).size)
 
     def rules_unique_identifiers(self, df, id_col):
         duplicates = self.metrics_unique_identifiers(df, id_col)
-        return duplicates == 0, f"{duplicates} duplicate identifiers found."
+        if duplicates == 0:
+            return True, ""
+        return False, f"{duplicates} duplicate identifiers found."
 
     # Schema Consistency
-    def metrics_schema_consistency(self, df, expected_columns):
-        return set(expected_columns) - set(df.columns)
+    @_memoize_on_df
+    def metrics_schema_consistency(self, df, expected_columns, expected_set=None):
+        expected = _expected_index(expected_columns, expected_set)
+        if df.columns is expected or df.columns.equals(expected):
+            return expected[:0]
+        return expected.difference(df.columns)
 
-    def rules_schema_consistency(self, df, expected_columns):
-        missing_cols = self.metrics_schema_consistency(df, expected_columns)
-        return len(missing_cols) == 0, f"Missing columns: {missing_cols}"
+    def rules_schema_consistency(self, df, expected_columns, expected_set=None):
+        missing_cols = self.metrics_schema_consistency(df, expected_columns, expected_set)
+        if len(missing_cols) == 0:
+            return True, ""
+        return False, f"Missing columns: {list(missing_cols)}"
 
     # Non-Null Checks
+    @_memoize_on_df
     def metrics_non_null(self, df, columns):
-        return {col: df[col].isnull().sum() for col in columns}
+        columns = list(columns)
+        cached = [self._fused_lookup(df, col) for col in columns]
+        if cached and all(result is not None for result in cached):
+            return {col: result["nulls"] for col, result in zip(columns, cached)}
+        if len(columns) >= _PARALLEL_MIN_COLUMNS and len(columns) * len(df) >= _PARALLEL_MIN_CELLS:
+            # The numpy/pandas null scans release the GIL, so wide frames scale across threads.
+            with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as pool:
+                return dict(zip(columns, pool.map(partial(_null_count, df), columns)))
+        dtypes = df.dtypes[columns]
+        if dtypes.nunique() > 1 or any(pd.api.types.is_extension_array_dtype(dtype) for dtype in dtypes):
+            # Mixed or extension dtypes would be upcast to a single object array; count per column instead.
+            return {col: _null_count(df, col) for col in columns}
+        if len(dtypes) and dtypes.iloc[0].kind in "iub":
+            return dict.fromkeys(columns, 0)
+        arr = df[columns].to_numpy()
+        if arr.dtype.kind == "f":
+            counts = np.isnan(arr).sum(axis=0)
+        else:
+            counts = pd.isna(arr).sum(axis=0)
+        return dict(zip(columns, counts.tolist()))
 
     def rules_non_null(self, df, columns):
         null_counts = self.metrics_non_null(df, columns)
+        if not any(null_counts.values()):
+            return True, ""
         invalid_cols = {col: count for col, count in null_counts.items() if count > 0}
-        return len(invalid_cols) == 0, f"Null values found in columns: {invalid_cols}"
+        return False, f"Null values found in columns: {invalid_cols}"
 
     # Threshold Limits
+    @_memoize_on_df
     def metrics_threshold(self, df, column, min_val, max_val):
-        return ((df[column] < min_val) | (df[column] > max_val)).sum()
+        cached = self._fused_lookup(df, column)
+        if cached is not None and cached["lo"] == min_val and cached["hi"] == max_val:
+            return cached["outliers"]
+        arr = _numeric_col(df, column)
+        if arr.dtype.kind in "fiu":
+            return count_out_of_range(arr, min_val, max_val)
+        return _count_out_of_range_series(df[column], min_val, max_val)
 
     def rules_threshold(self, df, column, min_val, max_val):
         outliers = self.metrics_threshold(df, column, min_val, max_val)
-        return outliers == 0, f"{outliers} values are outside the range [{min_val}, {max_val}]."
+        if outliers == 0:
+            return True, ""
+        return False, f"{outliers} values are outside the range [{min_val}, {max_val}]."
 
     # Dynamic Thresholds
+    @_memoize_on_df
     def metrics_dynamic_threshold(self, df, column, reference_value, tolerance):
-        return (
-            (df[column] < reference_value * (1 - tolerance)) |
-            (df[column] > reference_value * (1 + tolerance))
-        ).sum()
+        lower = reference_value * (1 - tolerance)
+        upper = reference_value * (1 + tolerance)
+        arr = _numeric_col(df, column)
+        if arr.dtype.kind in "fiu":
+            return count_out_of_range(arr, lower, upper)
+        return _count_out_of_range_series(df[column], lower, upper)
 
     def rules_dynamic_threshold(self, df, column, reference_value, tolerance):
         outliers = self.metrics_dynamic_threshold(df, column, reference_value, tolerance)
-        return outliers == 0, f"{outliers} values exceed dynamic thresholds."
+        if outliers == 0:
+            return True, ""
+        return False, f"{outliers} values exceed dynamic thresholds."
 
     # Variance Checks
+    @_memoize_on_df
     def metrics_variance(self, df, column):
+        cached = self._fused_lookup(df, column)
+        if cached is not None:
+            return cached["variance"]
+        arr = _numeric_col(df, column)
+        if arr.dtype.kind in "fiu":
+            return nanvar(arr, ddof=1)
         return df[column].var()
 
     def rules_variance(self, df, column, max_variance):
         variance = self.metrics_variance(df, column)
-        return variance <= max_variance, f"Variance ({variance}) exceeds the maximum allowed ({max_variance})."
+        if variance <= max_variance:
+            return True, ""
+        return False, f"Variance ({variance}) exceeds the maximum allowed ({max_variance})."
 
     # Anomaly Detection on Number of Records
-    def metrics_record_anomalies(self, record_counts, lookback_period=30):
-        mean = np.mean(record_counts[-lookback_period:])
-        std_dev = np.std(record_counts[-lookback_period:])
-        return mean, std_dev
+    def metrics_record_anomalies(self, record_counts=None, lookback_period=None, key=None):
+        """
+        Calculate the mean and standard deviation of the most recent record counts.
+
+        Parameters:
+        record_counts (RecordCountBuffer, array-like or number): Historical record
+            counts. Must be omitted when ``key`` is given.
+        lookback_period (int): Number of most recent counts to consider. Defaults
+            to 30, or to the stream's own window when ``key`` is given.
+        key (hashable, optional): Identifier of a stream fed through
+            update_record_counts; its statistics are read without modifying it.
 
-    def rules_record_anomalies(self, record_counts, current_count, lookback_period=30):
-        mean, std_dev = self.metrics_record_anomalies(record_counts, lookback_period)
+        Returns:
+        tuple: (mean, standard deviation) over the lookback window.
+        """
+        if key is not None:
+            if record_counts is not None:
+                raise ValueError("Pass new record counts to update_record_counts, not together with key.")
+            return self._anomaly_stats(key, lookback_period)
+        if lookback_period is None:
+            lookback_period = 30
+        if isinstance(record_counts, RecordCountBuffer):
+            window = record_counts.view_last(lookback_period)
+        else:
+            window = np.atleast_1d(np.asarray(record_counts))[-lookback_period:]
+        return np.mean(window), np.std(window)
+
+    def update_record_counts(self, key, record_counts, lookback_period=30):
+        """
+        Append newly observed record count(s) to a stream's rolling window.
+
+        The window mean and M2 are updated with Welford add/remove steps, so
+        each count costs O(1). Read the statistics back with
+        metrics_record_anomalies/rules_record_anomalies using the same ``key``.
+
+        Parameters:
+        key (hashable): Identifier of the stream.
+        record_counts (array-like or number): New record count(s), oldest first.
+        lookback_period (int): Window length; fixed for the lifetime of the stream.
+        """
+        record_counts = np.atleast_1d(np.asarray(record_counts, dtype=np.float64))
+        if not np.isfinite(record_counts).all():
+            raise ValueError(f"Record counts for stream {key!r} must be finite: {record_counts.tolist()}")
+        state = self._anomaly_state.get(key)
+        if state is None:
+            if lookback_period < 1:
+                raise ValueError("lookback_period must be a positive integer.")
+            state = self._anomaly_state[key] = [0, 0.0, 0.0, deque(maxlen=lookback_period)]
+        elif state[3].maxlen != lookback_period:
+            raise ValueError(
+                f"Stream {key!r} uses a lookback period of {state[3].maxlen}, not {lookback_period}."
+            )
+        n, mean, m2, window = state
+
+        for x in record_counts.tolist():
+            if len(window) == lookback_period:
+                old = window[0]
+                n -= 1
+                if n == 0:
+                    mean, m2 = 0.0, 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / n
+                    m2 -= delta * (old - mean)
+            window.append(x)
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+
+        state[0], state[1], state[2] = n, mean, m2
+
+    def _anomaly_stats(self, key, lookback_period):
+        state = self._anomaly_state.get(key)
+        if state is None:
+            raise ValueError(f"Unknown record-count stream {key!r}; feed it with update_record_counts first.")
+        n, mean, m2, window = state
+        if lookback_period is not None and lookback_period != window.maxlen:
+            raise ValueError(f"Stream {key!r} uses a lookback period of {window.maxlen}, not {lookback_period}.")
+        if n == 0:
+            return np.nan, np.nan
+        return mean, math.sqrt(max(m2, 0.0) / n)
+
+    def rules_record_anomalies(self, record_counts, current_count, lookback_period=None, key=None):
+        if np.ndim(current_count) > 0:
+            within = self.rules_record_anomalies_batch(record_counts, current_count, lookback_period, key=key)
+            if within.all():
+                return within, ""
+            outliers = np.asarray(current_count)[~within]
+            return within, f"Record counts {outliers.tolist()} are outside 3 standard deviations of the mean."
+        mean, std_dev = self.metrics_record_anomalies(record_counts, lookback_period, key=key)
         lower_limit = mean - 3 * std_dev
         upper_limit = mean + 3 * std_dev
-        return lower_limit <= current_count <= upper_limit, (
+        if lower_limit <= current_count <= upper_limit:
+            return True, ""
+        return False, (
             f"Record count {current_count} is outside 3 standard deviations "
             f"[{lower_limit}, {upper_limit}] of the mean."
         )
 
+    def rules_record_anomalies_batch(self, record_counts, current_counts, lookback_period=None, key=None):
+        """
+        Check many record counts against the same 3 standard deviation band.
+
+        Parameters:
+        record_counts (RecordCountBuffer, array-like or number): Historical record
+            counts, or None when ``key`` is given.
+        current_counts (array-like): Record counts to check.
+        lookback_period (int): See metrics_record_anomalies.
+        key (hashable, optional): See metrics_record_anomalies.
+
+        Returns:
+        np.ndarray: Boolean mask, True where the count lies within the band.
+        """
+        mean, std_dev = self.metrics_record_anomalies(record_counts, lookback_period, key=key)
+        lower_limit = mean - 3 * std_dev
+        upper_limit = mean + 3 * std_dev
+        current_counts = np.asarray(current_counts)
+        return (lower_limit <= current_counts) & (current_counts <= upper_limit)
+
+    def metrics_record_anomalies_rolling(self, record_counts, lookback_period=30):
+        """
+        Calculate the mean and standard deviation of every lookback window in
+        one pass over the record-count history.
+
+        Parameters:
+        record_counts (array-like): Historical record counts.
+        lookback_period (int): Window length.
+
+        Returns:
+        tuple: (means, standard deviations) arrays; position i covers the window
+        ending at i and the first ``lookback_period - 1`` positions are NaN.
+        """
+        if isinstance(record_counts, RecordCountBuffer):
+            record_counts = record_counts.view_last(record_counts.capacity)
+        return move_mean_std(record_counts, lookback_period)
+
+    def rules_record_anomalies_rolling(self, record_counts, lookback_period=30):
+        """
+        Check every record count against the 3 standard deviation band of the
+        ``lookback_period`` counts preceding it.
+
+        Returns:
+        np.ndarray: Boolean mask, True where the count lies within the band or
+        there is not yet a full window of history.
+        """
+        if isinstance(record_counts, RecordCountBuffer):
+            record_counts = record_counts.view_last(record_counts.capacity)
+        counts = np.asarray(record_counts, dtype=np.float64)
+        means, std_devs = self.metrics_record_anomalies_rolling(counts, lookback_period)
+        within = np.ones(counts.size, dtype=bool)
+        current, mean, std_dev = counts[lookback_period:], means[lookback_period - 1:-1], std_devs[lookback_period - 1:-1]
+        within[lookback_period:] = (mean - 3 * std_dev <= current) & (current <= mean + 3 * std_dev)
+        return within
+
     # Check Number of Records Greater Than Zero
     def metrics_non_zero_records(self, df):
         return len(df)
 
     def rules_non_zero_records(self, df):
         record_count = self.metrics_non_zero_records(df)
-        return record_count > 0, "No records found in the dataset."
+        if record_count > 0:
+            return True, ""
+        return False, "No records found in the dataset."
 
     # Check Column Names Consistency
-    def metrics_column_name_consistency(self, df, historical_columns):
-        return set(historical_columns) - set(df.columns)
+    @_memoize_on_df
+    def metrics_column_name_consistency(self, df, historical_columns, historical_set=None):
+        return _expected_index(historical_columns, historical_set).difference(df.columns)
 
-    def rules_column_name_consistency(self, df, historical_columns):
-        inconsistent_cols = self.metrics_column_name_consistency(df, historical_columns)
-        return len(inconsistent_cols) == 0, f"Inconsistent column names: {inconsistent_cols}"
+    def rules_column_name_consistency(self, df, historical_columns, historical_set=None):
+        inconsistent_cols = self.metrics_column_name_consistency(df, historical_columns, historical_set)
+        if len(inconsistent_cols) == 0:
+            return True, ""
+        return False, f"Inconsistent column names: {list(inconsistent_cols)}"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+import numpy as np
+
+
+class RecordCountBuffer:
+    """
+    Fixed-capacity ring buffer of historical record counts backed by a
+    preallocated NumPy array.
+
+    Every value is written twice (at ``head`` and ``head + capacity``) so the
+    most recent values are always available as one contiguous slice, without
+    copying or unwrapping the ring.
+    """
+
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer.")
+        self.capacity = capacity
+        self._buf = np.empty(2 * capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, record_count):
+        """
+        Append a record count, overwriting the oldest one when the buffer is full.
+        """
+        self._buf[self._head] = record_count
+        self._buf[self._head + self.capacity] = record_count
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def extend(self, record_counts):
+        """
+        Append several record counts in order.
+        """
+        for record_count in np.asarray(record_counts, dtype=np.float64).tolist():
+            self.push(record_count)
+
+    def view_last(self, n):
+        """
+        Return a read-only view of the ``n`` most recent record counts, oldest first.
+        """
+        n = min(n, self._size)
+        end = self._head + self.capacity
+        view = self._buf[end - n:end]
+        view.flags.writeable = False
+        return view
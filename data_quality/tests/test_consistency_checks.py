@@ -1,8 +1,12 @@
 import pytest
+import numpy as np
 import pandas as pd
 import sys
 
+from data_quality.checks import consistency
 from data_quality.checks import ConsistencyChecks
+from data_quality.checks.consistency import Check
+from data_quality.checks.utils import RecordCountBuffer
 
 class TestConsistencyChecks:
     @pytest.fixture(autouse=True)
@@ -34,24 +38,78 @@ class TestConsistencyChecks:
         assert metric == 1, "Expected 1 duplicate identifier."
         assert not rule, message
 
+    def test_unique_identifiers_on_sorted_ids(self):
+        df = pd.DataFrame({"id": [1, 2, 2, 2, 3, 4, 4]})
+        assert self.cc.metrics("unique_identifiers", df, "id") == 3, "Expected 3 duplicate identifiers."
+
+    def test_dispatch_by_check_enum(self, sample_data):
+        assert self.cc.metrics(Check.UNIQUE_IDENTIFIERS, sample_data, "id") == 1
+        rule, message = self.cc.rules(Check.NON_ZERO_RECORDS, sample_data)
+        assert rule, message
+        with pytest.raises(ValueError):
+            self.cc.metrics("unknown_check", sample_data)
+
     def test_schema_consistency(self, sample_data, historical_columns):
         metric = self.cc.metrics("schema_consistency", sample_data, historical_columns)
         rule, message = self.cc.rules("schema_consistency", sample_data, historical_columns)
         assert len(metric) == 0, f"Unexpected missing columns: {metric}"
         assert rule, message
 
+    def test_schema_consistency_message_lists_missing_columns(self, sample_data, historical_columns):
+        rule, message = self.cc.rules("schema_consistency", sample_data, historical_columns + ["extra"])
+        assert not rule and message == "Missing columns: ['extra']", message
+
     def test_non_null_checks(self, sample_data):
         metric = self.cc.metrics("non_null", sample_data, ["name"])
         rule, message = self.cc.rules("non_null", sample_data, ["name"])
         assert metric["name"] == 1, "Expected 1 null value in 'name'."
         assert not rule, message
 
+    def test_non_null_checks_on_thread_pool(self, monkeypatch):
+        monkeypatch.setattr(consistency, "_PARALLEL_MIN_COLUMNS", 2)
+        monkeypatch.setattr(consistency, "_PARALLEL_MIN_CELLS", 1)
+        df = pd.DataFrame(
+            {
+                "float": [1.0, np.nan, 3.0, np.nan],
+                "object": pd.Series(["a", None, "c", "d"], dtype=object),
+                "nullable": pd.array([1, 2, None, 4], dtype="Int64"),
+                "int": [1, 2, 3, 4],
+            }
+        )
+        metric = self.cc.metrics("non_null", df, list(df.columns))
+        assert metric == df.isna().sum().to_dict(), "Thread-pool null counts should match DataFrame.isna()."
+
     def test_threshold_limits(self, sample_data):
         metric = self.cc.metrics("threshold", sample_data, "value", 10, 50)
         rule, message = self.cc.rules("threshold", sample_data, "value", 10, 50)
         assert metric == 0, "Expected no values outside threshold limits."
         assert rule, message
 
+    def test_threshold_limits_on_nullable_column(self):
+        df = pd.DataFrame({"value": pd.array([10, None, 60], dtype="Int64")})
+        metric = self.cc.metrics("threshold", df, "value", 10, 50)
+        assert metric == 1, "Expected 1 value outside threshold limits; nulls are not outliers."
+
+    def test_threshold_limits_on_string_column_with_nulls(self):
+        df = pd.DataFrame({"object": ["x", None, "z"], "string": pd.array(["x", None, "z"], dtype="string")})
+        assert self.cc.metrics("threshold", df, "object", "a", "y") == 1, "Expected only 'z' outside ['a', 'y']."
+        assert self.cc.metrics("threshold", df, "string", "a", "y") == 1, "Expected only 'z' outside ['a', 'y']."
+        objects = pd.DataFrame({"value": [1, None, 3]}, dtype=object)
+        assert self.cc.metrics("dynamic_threshold", objects, "value", 2, 0.1) == 2
+
+    def test_extension_dtype_warning_points_at_caller(self, monkeypatch, sample_data):
+        df = pd.DataFrame({"value": pd.array([10, None, 60], dtype="Int64")})
+        for call in (
+            lambda: self.cc.metrics("threshold", df, "value", 10, 50),
+            lambda: self.cc.rules(Check.VARIANCE, df, "value", 100),
+            lambda: self.cc.fused_column_metrics(df, "value", 10, 50),
+        ):
+            monkeypatch.setattr(consistency, "_converted_dtypes", set())
+            self.cc.clear_cache()
+            with pytest.warns(pd.errors.PerformanceWarning) as record:
+                call()
+            assert record[0].filename == __file__, "The warning should point at the calling code."
+
     def test_dynamic_thresholds(self, sample_data):
         metric = self.cc.metrics("dynamic_threshold", sample_data, "value", 30, 0.5)
         rule, message = self.cc.rules("dynamic_threshold", sample_data, "value", 30, 0.5)
@@ -70,6 +128,52 @@ class TestConsistencyChecks:
         assert metric == 0, "Expected no anomalies in record counts."
         assert rule, message
 
+    def test_incremental_anomaly_detection_on_records(self, record_counts):
+        for count in record_counts:
+            self.cc.update_record_counts("daily", count, lookback_period=5)
+        mean, std_dev = self.cc.metrics("record_anomalies", key="daily")
+        rule, message = self.cc.rules("record_anomalies", None, 100, key="daily")
+        window = record_counts.to_numpy()[-5:]
+        assert mean == pytest.approx(window.mean()), "Rolling mean should match the window mean."
+        assert std_dev == pytest.approx(window.std()), "Rolling std should match the window std."
+        assert self.cc.metrics("record_anomalies", key="daily") == (mean, std_dev), "Reads should not change the stream."
+        assert rule, message
+        with pytest.raises(ValueError):
+            self.cc.update_record_counts("daily", 100, lookback_period=10)
+
+    def test_incremental_anomaly_detection_rejects_invalid_input(self):
+        with pytest.raises(ValueError):
+            self.cc.update_record_counts("daily", [100, float("nan")], lookback_period=5)
+        with pytest.raises(ValueError):
+            self.cc.update_record_counts("daily", 100, lookback_period=0)
+        with pytest.raises(ValueError):
+            self.cc.metrics("record_anomalies", key="daily")
+        self.cc.update_record_counts("daily", [100, 110], lookback_period=5)
+        with pytest.raises(ValueError):
+            self.cc.rules("record_anomalies", None, 100, key="dialy")
+
+    def test_anomaly_detection_on_record_buffer(self, record_counts):
+        buffer = RecordCountBuffer(capacity=10)
+        buffer.extend(record_counts)
+        mean, std_dev = self.cc.metrics("record_anomalies", buffer, 5)
+        window = record_counts.to_numpy()[-5:]
+        assert mean == pytest.approx(window.mean()), "Buffer mean should match the window mean."
+        assert std_dev == pytest.approx(window.std()), "Buffer std should match the window std."
+
+    def test_batch_anomaly_detection_on_records(self, record_counts):
+        within = self.cc.rules_record_anomalies_batch(record_counts, [100, 1000, 0])
+        assert within.tolist() == [True, False, False], "Expected only the first count within the band."
+        rule, message = self.cc.rules("record_anomalies", record_counts, [100, 1000, 0])
+        assert rule.tolist() == within.tolist(), message
+        rule, message = self.cc.rules("record_anomalies", record_counts, [100, 105])
+        assert rule.all() and message == "", message
+
+    def test_rolling_anomaly_detection_on_records(self, record_counts):
+        counts = pd.concat([record_counts, pd.Series([1000])], ignore_index=True)
+        within = self.cc.rules_record_anomalies_rolling(counts, lookback_period=5)
+        assert within[:-1].all(), "Expected historical counts within their rolling bands."
+        assert not within[-1], "Expected the final spike to be flagged."
+
     def test_record_count_greater_than_zero(self, sample_data):
         metric = self.cc.metrics("record_count_greater_than_zero", sample_data)
         rule, message = self.cc.rules("record_count_greater_than_zero", sample_data)
@@ -81,3 +185,29 @@ class TestConsistencyChecks:
         rule, message = self.cc.rules("column_names_consistency", sample_data, historical_columns)
         assert len(metric) == 0, "Column names should match the historical schema."
         assert rule, message
+
+    def test_prepare_makes_columns_contiguous(self):
+        df = pd.DataFrame(np.arange(20.0).reshape(10, 2), columns=["a", "b"], copy=False)
+        prepared = ConsistencyChecks.prepare(df)
+        assert prepared["a"].to_numpy(copy=False).flags["C_CONTIGUOUS"], "Columns should be contiguous."
+        assert ConsistencyChecks.prepare(prepared) is prepared, "Contiguous frames should be returned as-is."
+
+    def test_fused_column_metrics(self, sample_data):
+        fused = self.cc.fused_column_metrics(sample_data, "value", 15, 45)
+        assert fused["nulls"] == 0, "Expected no null values in 'value'."
+        assert fused["outliers"] == 2, "Expected 2 values outside [15, 45]."
+        assert fused["variance"] == pytest.approx(sample_data["value"].var())
+        assert self.cc.metrics("threshold", sample_data, "value", 15, 45) == fused["outliers"]
+
+    def test_metrics_are_memoized_until_cache_cleared(self, sample_data):
+        assert self.cc.metrics("unique_identifiers", sample_data, "id") == 1
+        sample_data.loc[4, "id"] = 5
+        assert self.cc.metrics("unique_identifiers", sample_data, "id") == 1, "Expected the memoized result."
+        self.cc.clear_cache()
+        assert self.cc.metrics("unique_identifiers", sample_data, "id") == 0, "Expected a fresh result."
+
+    def test_memoized_metrics_are_not_shared_with_callers(self, sample_data):
+        metric = self.cc.metrics("non_null", sample_data, ["name"])
+        metric["name"] = 0
+        rule, message = self.cc.rules("non_null", sample_data, ["name"])
+        assert not rule, message